@@ -17,14 +17,6 @@ class Vertex:
     y: float
     z: float
 
-    def vertex_to_point(self) -> np.ndarray:
-        """Transform the 3D coordinate of the vertex object into a np array.
-
-        Returns:
-            numpy.array [3]: x, y, z values
-        """
-        return np.array([self.x, self.y, self.z])
-
 @dataclass
 class Face:
     """Represents a triangular face with three vertex IDs
@@ -35,25 +27,19 @@ class Face:
     """
     vertex_ids: Tuple[int, int, int]
     
-    def calculate_normal(self, vertices: List[Vertex]) -> np.ndarray:
+    def calculate_normal(self, vertex_xyz: np.ndarray) -> np.ndarray:
         """Calculate the normal vector of the face
         
         Args:
-            vertices (List[Vertex]): all the vertices in the dataset
+            vertex_xyz (np.ndarray [N, 3]): coordinates of all the vertices in the dataset
 
         Returns:
             numpy.array [3]: normalized normal vector of the face
         """
-        v1 = vertices[self.vertex_ids[0] - 1]
-        v2 = vertices[self.vertex_ids[1] - 1]
-        v3 = vertices[self.vertex_ids[2] - 1]
-        
-        # Create vectors from vertices
-        vec1 = np.array([v2.x - v1.x, v2.y - v1.y, v2.z - v1.z])
-        vec2 = np.array([v3.x - v1.x, v3.y - v1.y, v3.z - v1.z])
+        v1, v2, v3 = vertex_xyz[np.asarray(self.vertex_ids) - 1]
         
         # Calculate cross product
-        normal = np.cross(vec1, vec2)
+        normal = np.cross(v2 - v1, v3 - v1)
         
         # Normalize
         return normal / (np.linalg.norm(normal) + 1e-10) # add a small value to prevent zero devision error
@@ -61,12 +47,72 @@ class Face:
 class Object3D:
     """Represents a 3D object with vertices and faces.
 
-    This class stores the geometric data of a 3D object and provides methods
-    to load the data from a file.
+    This class stores the geometric data of a 3D object as contiguous numpy arrays
+    (one row per vertex / face) and provides methods to load the data from a file.
     """
     def __init__(self):
-        self.vertices: List[Vertex] = []
-        self.faces: List[Face] = []
+        self.vertex_ids: np.ndarray = np.empty(0, dtype=np.int64) # vertex ids as given in the file
+        self.vertex_xyz: np.ndarray = np.empty((0, 3), dtype=np.float32)
+        self.face_idx: np.ndarray = np.empty((0, 3), dtype=np.int32) # zero-based vertex indices
+        self.face_normals: np.ndarray = np.empty((0, 3), dtype=np.float32) # filled at load time
+        self.edges: np.ndarray = np.empty((0, 2), dtype=np.int32) # unique vertex index pairs, filled at load time
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """Vertices of the object as Vertex objects (built on demand, not used for rendering).
+
+        Returns:
+            List[Vertex]: all the vertices in the dataset
+        """
+        return [Vertex(vid, x, y, z) for vid, (x, y, z) in zip(self.vertex_ids.tolist(), self.vertex_xyz.tolist())]
+
+    @property
+    def faces(self) -> List[Face]:
+        """Faces of the object as Face objects (built on demand, not used for rendering).
+
+        Returns:
+            List[Face]: all the faces in the dataset
+        """
+        return [Face(tuple(ids)) for ids in (self.face_idx + 1).tolist()]
+
+    def compute_face_normals(self) -> np.ndarray:
+        """Calculate the normalized normal vectors of all the faces at once.
+
+        The result is stored in self.face_normals, it only needs recomputing when the geometry changes.
+
+        Returns:
+            numpy.array [M, 3]: normalized normal vector of each face
+        """
+        v1 = self.vertex_xyz[self.face_idx[:, 0]]
+        vec1 = self.vertex_xyz[self.face_idx[:, 1]] - v1
+        vec2 = self.vertex_xyz[self.face_idx[:, 2]] - v1
+        
+        # Cross product written out per component, cheaper than np.cross on [M, 3] arrays
+        normals = np.empty_like(vec1)
+        normals[:, 0] = vec1[:, 1] * vec2[:, 2] - vec1[:, 2] * vec2[:, 1]
+        normals[:, 1] = vec1[:, 2] * vec2[:, 0] - vec1[:, 0] * vec2[:, 2]
+        normals[:, 2] = vec1[:, 0] * vec2[:, 1] - vec1[:, 1] * vec2[:, 0]
+        
+        # Normalize
+        norms = np.sqrt(np.einsum('ij,ij->i', normals, normals))
+        normals /= norms[:, np.newaxis] + 1e-10 # add a small value to prevent zero devision error
+        self.face_normals = normals
+        
+        return self.face_normals
+
+    def compute_edges(self) -> np.ndarray:
+        """Collect the unique edges of all the faces.
+
+        Edges shared by neighbouring faces are only kept once. The result is stored in self.edges.
+
+        Returns:
+            numpy.array [E, 2]: zero-based vertex indices of each edge, smaller index first
+        """
+        edges = np.concatenate([self.face_idx[:, [0, 1]], self.face_idx[:, [1, 2]], self.face_idx[:, [2, 0]]])
+        edges.sort(axis=1)
+        self.edges = np.unique(edges, axis=0)
+        
+        return self.edges
         
     def load_from_file(self, filename: str) -> None:
         """Load 3D object data from a formatted text file.
@@ -80,18 +126,33 @@ class Object3D:
             filename (str): relative path to the data file
         """
         with open(filename, 'r') as f:
-            # Read number of vertices and faces
-            num_vertices, num_faces = map(int, f.readline().strip().split(','))
-            
-            # Read vertices
-            for _ in range(num_vertices):
-                vid, x, y, z = map(float, f.readline().strip().split(','))
-                self.vertices.append(Vertex(int(vid), x, y, z))
-                
-            # Read faces
-            for _ in range(num_faces):
-                v1, v2, v3 = map(int, f.readline().strip().split(','))
-                self.faces.append(Face((v1, v2, v3)))
+            data = f.read().splitlines()
+        
+        # Read number of vertices and faces
+        num_vertices, num_faces = map(int, data[0].split(','))
+        
+        # Empty blocks skip np.loadtxt, which would warn and return shape [0, 1]
+        
+        # Read vertices, the id column is kept apart from the coordinates
+        vertex_lines = data[1:1 + num_vertices]
+        if vertex_lines:
+            vertex_data = np.loadtxt(vertex_lines, delimiter=',', ndmin=2)
+            self.vertex_ids = vertex_data[:, 0].astype(np.int64)
+            self.vertex_xyz = vertex_data[:, 1:4].astype(np.float32)
+        else:
+            self.vertex_ids = np.empty(0, dtype=np.int64)
+            self.vertex_xyz = np.empty((0, 3), dtype=np.float32)
+        
+        # Read faces (ids in the file are one-based)
+        face_lines = data[1 + num_vertices:1 + num_vertices + num_faces]
+        if face_lines:
+            self.face_idx = np.loadtxt(face_lines, delimiter=',', dtype=np.int32, ndmin=2) - 1
+        else:
+            self.face_idx = np.empty((0, 3), dtype=np.int32)
+        
+        # Normals in object space and edges do not change while rotating, compute them once
+        self.compute_face_normals()
+        self.compute_edges()
 
 class BaseRenderer:
     """Base renderer class providing common functionality for 2D and 3D rendering.
@@ -102,29 +163,35 @@ class BaseRenderer:
     def __init__(self, canvas: tk.Canvas):
         self.canvas = canvas
         self.scale = 100
+        
+        # Cache the canvas size so rendering does not query Tk for it, updated on resize
+        self.canvas_width = canvas.winfo_width()
+        self.canvas_height = canvas.winfo_height()
+        self.canvas.bind("<Configure>", self.on_resize, add='+')
     
-    def calculate_bounding_box(self, obj: Object3D) -> Tuple[float, float, float, float]:
+    def on_resize(self, event) -> None:
+        """Update the cached canvas size.
+
+        Args:
+            event: tkinter configure event
+        """
+        self.canvas_width = event.width
+        self.canvas_height = event.height
+    
+    def calculate_bounding_box(self, obj: Object3D) -> Tuple[float, float, float, float, float, float]:
         """Calculate the bounding box of the 3D object.
 
         Args:
             obj (Object3D): the 3D object to analyze
 
         Returns:
-            Tuple[float, float, float, float]: minimum x, maximum x, minimum y, maximum y coordinates
+            Tuple[float, float, float, float, float, float]: minimum and maximum x, y, z coordinates
         """
-        min_x = min_y = min_z = float('inf')
-        max_x = max_y = max_z = float('-inf')
-        
-        for vertex in obj.vertices:
-            point = vertex.vertex_to_point()
-            min_x = min(min_x, point[0])
-            max_x = max(max_x, point[0])
-            min_y = min(min_y, point[1])
-            max_y = max(max_y, point[1])
-            min_z = min(min_z, point[2])
-            max_z = max(max_z, point[2])
-            
-        return min_x, max_x, min_y, max_y, min_z, max_z
+        # NaN coordinates are skipped, the initial values keep an object without vertices at an empty (inf, -inf) box
+        min_xyz = np.nanmin(obj.vertex_xyz, axis=0, initial=np.inf)
+        max_xyz = np.nanmax(obj.vertex_xyz, axis=0, initial=-np.inf)
+        
+        return min_xyz[0], max_xyz[0], min_xyz[1], max_xyz[1], min_xyz[2], max_xyz[2]
     
     def normalize_scale(self, obj: Object3D, target_ratio: float = 0.5, is_3d: bool = True) -> None:
         """Calculate scale factor to make object fill target ratio of window.
@@ -136,8 +203,8 @@ class BaseRenderer:
         """
         min_x, max_x, min_y, max_y, min_z, max_z = self.calculate_bounding_box(obj)
         
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width = self.canvas_width
+        canvas_height = self.canvas_height
         
         obj_width = max_x - min_x
         obj_height = max_y - min_y
@@ -162,8 +229,21 @@ class BaseRenderer:
         Returns:
             Tuple[float, float]: x, y screen coordinates
         """
-        screen_x = self.canvas.winfo_width() / 2 + point[0] * self.scale
-        screen_y = self.canvas.winfo_height() / 2 - point[1] * self.scale
+        screen_x = self.canvas_width / 2 + point[0] * self.scale
+        screen_y = self.canvas_height / 2 - point[1] * self.scale
+        return screen_x, screen_y
+
+    def project_points(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Project an array of 3D points to 2D screen coordinates in one pass.
+
+        Args:
+            points (np.ndarray [N, 3]): 3D point coordinates
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: x, y screen coordinates, each of shape [N]
+        """
+        screen_x = self.canvas_width / 2 + points[:, 0] * self.scale
+        screen_y = self.canvas_height / 2 - points[:, 1] * self.scale
         return screen_x, screen_y
 
 class Renderer2D(BaseRenderer):
@@ -180,20 +260,18 @@ class Renderer2D(BaseRenderer):
         self.normalize_scale(obj, is_3d=False)
         self.canvas.delete("all")
         
-        # Draw edges
-        for face in obj.faces:
-            for i in range(3):
-                v1 = obj.vertices[face.vertex_ids[i] - 1]
-                v2 = obj.vertices[face.vertex_ids[(i + 1) % 3] - 1]
-                
-                x1, y1 = self.project_point(v1.vertex_to_point())
-                x2, y2 = self.project_point(v2.vertex_to_point())
-                
-                self.canvas.create_line(x1, y1, x2, y2, fill='blue', width=1)
+        # Project all vertices at once
+        screen_x, screen_y = self.project_points(obj.vertex_xyz)
+        
+        # Draw edges, each shared edge only once, from flat x1, y1, x2, y2 rows
+        lines = np.empty((len(obj.edges), 4), dtype=screen_x.dtype)
+        lines[:, 0::2] = screen_x[obj.edges]
+        lines[:, 1::2] = screen_y[obj.edges]
+        for line in lines.tolist():
+            self.canvas.create_line(line, fill='blue', width=1)
         
         # Draw vertices
-        for v in obj.vertices:
-            x, y = self.project_point(v.vertex_to_point())
+        for x, y in zip(screen_x.tolist(), screen_y.tolist()):
             self.canvas.create_oval(x-3, y-3, x+3, y+3, fill='blue')
 
 class Application:
@@ -2,10 +2,43 @@ import tkinter as tk
 from tkinter import filedialog
 import numpy as np
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional
 import math
 from viewer_2d import BaseRenderer, Object3D, Vertex, Face
 
+# Hex color code for every value of the blue channel, built once at import time
+HEX_BLUE = tuple('#0000%02x' % value for value in range(256))
+
+def project_all(vertex_xyz: np.ndarray, rotation: np.ndarray, half_width: float, half_height: float, scale: float,
+                transformed_xyz: np.ndarray, screen_x: np.ndarray, screen_y: np.ndarray) -> None:
+    """Rotate and project all vertices, writing into preallocated output arrays.
+
+    Args:
+        vertex_xyz (np.ndarray [N, 3]): object space vertex coordinates
+        rotation (np.ndarray [3, 3]): rotation matrix
+        half_width, half_height (float): center of the canvas in screen coordinates
+        scale (float): object to screen scale factor
+        transformed_xyz (np.ndarray [N, 3]): output, rotated vertex coordinates (column 2 is the depth)
+        screen_x, screen_y (np.ndarray [N]): output, screen coordinates of the vertices
+    """
+    np.matmul(vertex_xyz, rotation.T, out=transformed_xyz)
+    np.multiply(transformed_xyz[:, 0], scale, out=screen_x)
+    screen_x += half_width
+    np.multiply(transformed_xyz[:, 1], -scale, out=screen_y)
+    screen_y += half_height
+
+def rotate_normals(face_normals: np.ndarray, rotation: np.ndarray, transformed_normals: np.ndarray) -> None:
+    """Rotate all face normals, writing into a preallocated output array.
+
+    A rotation keeps vector lengths, so unit normals stay unit normals and need no renormalization.
+
+    Args:
+        face_normals (np.ndarray [M, 3]): object space unit face normals
+        rotation (np.ndarray [3, 3]): rotation matrix
+        transformed_normals (np.ndarray [M, 3]): output, rotated unit face normals
+    """
+    np.matmul(face_normals, rotation.T, out=transformed_normals)
+
 class Renderer3D(BaseRenderer):
     """3D renderer with rotation and shading capabilities.
 
@@ -22,65 +55,128 @@ class Renderer3D(BaseRenderer):
         self.last_x = 0
         self.last_y = 0
         
-    def transform_point(self, point: np.ndarray) -> np.ndarray:
-        """Apply rotation transformation to a 3D point.
+        # Combined rotation matrix, allocated once and refilled in place by _update_rotation_matrix
+        self._R = np.zeros((3, 3), dtype=np.float32)
+        self._update_rotation_matrix()
+        
+        # Skip faces whose normal points away from the viewer. Only valid for closed meshes
+        # with consistent (counter-clockwise from outside) winding, so it is off by default.
+        self.backface_cull = False
+        
+        # Per-vertex and per-face output buffers reused by every render, resized when the counts change
+        self._transformed_xyz = np.empty((0, 3), dtype=np.float32)
+        self._screen_x = np.empty(0, dtype=np.float32)
+        self._screen_y = np.empty(0, dtype=np.float32)
+        self._transformed_normals = np.empty((0, 3), dtype=np.float32)
+        self._polygons = np.empty((0, 6), dtype=np.float32)
+        
+        # Set between mouse press and release, polygon outlines are not stroked meanwhile
+        self._dragging = False
+        
+        # Tk after_idle job of a render triggered by dragging that has not run yet
+        self._render_job = None
+        
+        # Canvas items reused across renders of the same object, see _build_item_pool
+        self._pool_obj = None
+        self._poly_ids: List[int] = []
+        self._dot_ids: List[int] = []
+        self._num_shown = 0  # polygon items currently in the 'normal' state, the rest are hidden
+        self._slot_colors = np.empty(0, dtype=np.intp)  # blue value last written to each polygon item
+        self._dot_shown = np.empty(0, dtype=bool)  # oval items currently in the 'normal' state
+        
+    def _ensure_buffers(self, obj: Object3D) -> None:
+        """(Re)allocate the per-vertex and per-face output buffers if they do not fit the object.
 
         Args:
-            point (np.ndarray): original 3D point coordinates
-
-        Returns:
-            np.ndarray: transformed 3D point coordinates
+            obj (Object3D): the 3D object about to be rendered
         """
+        num_vertices = len(obj.vertex_xyz)
+        if len(self._screen_x) != num_vertices or self._screen_x.dtype != obj.vertex_xyz.dtype:
+            self._transformed_xyz = np.empty((num_vertices, 3), dtype=obj.vertex_xyz.dtype)
+            self._screen_x = np.empty(num_vertices, dtype=obj.vertex_xyz.dtype)
+            self._screen_y = np.empty(num_vertices, dtype=obj.vertex_xyz.dtype)
         
-        rx_matrix = np.array([
-            [1.0, 0.0, 0.0],
-            [0.0, np.cos(self.rotation_x), -np.sin(self.rotation_x)],
-            [0.0, np.sin(self.rotation_x), np.cos(self.rotation_x)]
-        ])
+        num_faces = len(obj.face_idx)
+        if len(self._polygons) != num_faces or self._polygons.dtype != obj.vertex_xyz.dtype:
+            self._transformed_normals = np.empty((num_faces, 3), dtype=obj.vertex_xyz.dtype)
+            self._polygons = np.empty((num_faces, 6), dtype=obj.vertex_xyz.dtype)
         
-        ry_matrix = np.array([
-            [np.cos(self.rotation_y), 0.0, np.sin(self.rotation_y)],
-            [0.0, 1.0, 0.0],
-            [-np.sin(self.rotation_y), 0.0, np.cos(self.rotation_y)]
-        ])
+    def _build_item_pool(self, obj: Object3D) -> None:
+        """Create one polygon item per face and one oval item per vertex on a cleared canvas.
+
+        Polygons are stacked in creation order, so render() fills the lowest slot with the
+        furthest face instead of restacking items. The vertex dots are created last to stay on top.
+
+        Args:
+            obj (Object3D): the 3D object the items are created for
+        """
+        self.canvas.delete("all")
+        outline = '' if self._dragging else 'blue'
+        self._poly_ids = [self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill='', outline=outline, tags='face')
+                          for _ in range(len(obj.face_idx))]
+        self._dot_ids = [self.canvas.create_oval(0, 0, 0, 0, fill='blue', tags='vertex')
+                         for _ in range(len(obj.vertex_xyz))]
+        self._pool_obj = obj
+        self._num_shown = len(self._poly_ids)
+        self._slot_colors = np.full(len(self._poly_ids), -1, dtype=np.intp)
+        self._dot_shown = np.ones(len(self._dot_ids), dtype=bool)
         
-        point = rx_matrix @ point
-        point = ry_matrix @ point
+    def _show_polygons(self, count: int) -> None:
+        """Show the first count polygon items and hide the others, touching only items that change.
+
+        Args:
+            count (int): number of faces drawn this frame
+        """
+        for poly_id in self._poly_ids[count:self._num_shown]:
+            self.canvas.itemconfigure(poly_id, state='hidden')
+        for poly_id in self._poly_ids[self._num_shown:count]:
+            self.canvas.itemconfigure(poly_id, state='normal')
+        self._num_shown = count
         
-        return point
-    
-    def project_point(self, point: np.ndarray) -> Tuple[float, float]:
-        """Project 3D point to 2D screen coordinates with depth information.
+    def _show_dots(self, valid: np.ndarray) -> None:
+        """Show the oval items of valid vertices and hide the others, touching only items that change.
 
         Args:
-            point (np.ndarray): 3D point coordinates
+            valid (np.ndarray [N]): whether each vertex has valid screen coordinates this frame
+        """
+        for i in np.flatnonzero(valid != self._dot_shown).tolist():
+            self.canvas.itemconfigure(self._dot_ids[i], state='normal' if valid[i] else 'hidden')
+        self._dot_shown[:] = valid
+        
+    def _update_rotation_matrix(self) -> None:
+        """Refill the cached rotation matrix self._R in place from the current rotation angles.
 
-        Returns:
-            Tuple[float, float, float]: x, y screen coordinates and z depth value
+        The rotation about the X axis is applied first, then the rotation about the Y axis,
+        so the result equals ry_matrix @ rx_matrix.
         """
-        screen_x = self.canvas.winfo_width() / 2 + point[0] * self.scale
-        screen_y = self.canvas.winfo_height() / 2 - point[1] * self.scale
+        cos_x, sin_x = math.cos(self.rotation_x), math.sin(self.rotation_x)
+        cos_y, sin_y = math.cos(self.rotation_y), math.sin(self.rotation_y)
         
-        return screen_x, screen_y, point[2]  # Return z for depth sorting
-    
-    def calculate_color(self, normal: np.ndarray) -> str:
-        """Calculate face color based on angle with Z-axis.
+        R = self._R  # R[1, 0] is always 0
+        R[0, 0] = cos_y
+        R[0, 1] = sin_x * sin_y
+        R[0, 2] = cos_x * sin_y
+        R[1, 1] = cos_x
+        R[1, 2] = -sin_x
+        R[2, 0] = -sin_y
+        R[2, 1] = sin_x * cos_y
+        R[2, 2] = cos_x * cos_y
+        
+    def calculate_color(self, normals: np.ndarray) -> np.ndarray:
+        """Calculate face colors based on angle with Z-axis.
 
         Args:
-            normal (np.ndarray): face normal vector
+            normals (np.ndarray [M, 3]): normalized face normal vectors
 
         Returns:
-            str: hex color code based on face orientation
+            np.ndarray [M]: blue channel value of each face based on its orientation, index into HEX_BLUE for the hex color code
         """
         # Calculate angle between normal and z-axis, which in this case is the abs z value of normal
-        angle = np.arccos(abs(normal[2]))
-        angle_deg = math.degrees(angle)
+        angle_deg = np.degrees(np.arccos(np.minimum(np.abs(normals[:, 2]), 1.0)))
         
         # Interpolate between colors #00005F (on edge) and #0000FF (flat)
         intensity = 1 - (angle_deg / 90)  # 1 when flat, 0 when edge
-        color_value = int(95 + intensity * 160)  # Interpolate between 95 (5F) and 255 (FF)
-        
-        return f'#{0:02x}{0:02x}{color_value:02x}'
+        return (95 + intensity * 160).astype(np.intp)  # Interpolate between 95 (5F) and 255 (FF)
     
     def render(self, obj: Object3D) -> None:
         """Render the 3D object with shaded faces and depth sorting.
@@ -91,53 +187,72 @@ class Renderer3D(BaseRenderer):
         Args:
             obj (Object3D): the 3D object to render
         """
+        # A direct render supersedes a pending drag render, which may still refer to a previous object
+        if self._render_job is not None:
+            self.canvas.after_cancel(self._render_job)
+            self._render_job = None
+        
         self.normalize_scale(obj, is_3d=True)
-        self.canvas.delete("all")
+        if (obj is not self._pool_obj or len(self._poly_ids) != len(obj.face_idx)
+                or len(self._dot_ids) != len(obj.vertex_xyz)):
+            self._build_item_pool(obj)
+        
+        # Rotate and project all vertices at once
+        self._ensure_buffers(obj)
+        self._update_rotation_matrix()
+        rotation = self._R
+        project_all(obj.vertex_xyz, rotation, self.canvas_width / 2, self.canvas_height / 2, self.scale,
+                    self._transformed_xyz, self._screen_x, self._screen_y)
+        screen_x, screen_y = self._screen_x, self._screen_y
+        depth = self._transformed_xyz[:, 2]
+        
+        # Rotate the object space normals computed at load time with the same matrix
+        rotate_normals(obj.face_normals, rotation, self._transformed_normals)
+        transformed_normals = self._transformed_normals
+        
+        # The viewer looks down the Z axis, so faces whose rotated normal points to -Z are facing away.
+        # Culled faces are dropped here, before any further per-face work.
+        if self.backface_cull:
+            visible = np.flatnonzero(transformed_normals[:, 2] > 0)
+        else:
+            visible = np.arange(len(obj.face_idx))
         
-        # Calculate and sort faces by depth
-        face_data = []
-        for face in obj.faces:
-            # Get vertices of the face
-            vertices = [obj.vertices[vid - 1] for vid in face.vertex_ids]
-            
-            # Calculate normal before rotation
-            normal = face.calculate_normal(obj.vertices)
-
-            # Transform vertices and normal
-            transformed_vertices = [self.transform_point(v.vertex_to_point()) for v in vertices]
-            transformed_normal = self.transform_point(normal)
-            transformed_normal = transformed_normal / (np.linalg.norm(transformed_normal) + 1e-10) # add a small value to prevent zero devision error
-
-            # Project vertices
-            projected_vertices = [self.project_point(v) for v in transformed_vertices]
-            
-            # Calculate center point for depth sorting
-            center_z = sum(v[2] for v in transformed_vertices) / 3
-            
-            color = self.calculate_color(transformed_normal)
-            
-            face_data.append((
-                center_z,  # Use rotated center Z for depth sorting
-                projected_vertices,
-                color
-            ))
-            
         # Sort faces by depth (painter's algorithm) - furthest first
-        face_data.sort(key=lambda x: x[0])  #sort in ascending order
-        
-        # Draw faces from back to front
-        for _, vertices, color in face_data:
-            points = [(v[0], v[1]) for v in vertices]
-            # Only draw if we have valid points
-            self.canvas.create_polygon(points, fill=color, outline='blue')
-        
-        # Draw vertices
-        for v in obj.vertices:
-            point = self.transform_point(v.vertex_to_point())
-            x, y, _ = self.project_point(point)
-            # Only draw if we have valid coordinates
-            if not math.isnan(x) and not math.isnan(y):
-                self.canvas.create_oval(x-3, y-3, x+3, y+3, fill='blue')
+        # Use rotated center Z for depth sorting, the sum of the corner depths gives the same order without dividing by 3
+        depth_key = depth[obj.face_idx[visible]].sum(axis=1)
+        order = visible[np.argsort(depth_key, kind='stable')]  # sort in ascending order
+        num_drawn = len(order)
+        
+        # Colors of the drawn faces, in drawing order
+        slot_colors = self.calculate_color(transformed_normals[order])
+        
+        # Gather the projected corners of the drawn faces, in drawing order, as flat x1, y1, x2, y2, x3, y3 rows.
+        # The rows are handed to Tk as plain lists, which it takes without any string conversion.
+        ordered_faces = obj.face_idx[order]
+        np.take(screen_x, ordered_faces, out=self._polygons[:num_drawn, 0::2])
+        np.take(screen_y, ordered_faces, out=self._polygons[:num_drawn, 1::2])
+        polygons = self._polygons[:num_drawn].tolist()
+        
+        # Update faces from back to front, the lowest polygon item gets the furthest face.
+        # The fill is only reconfigured for items whose color differs from the last frame.
+        color_changed = slot_colors != self._slot_colors[:num_drawn]
+        for poly_id, polygon, color, changed in zip(self._poly_ids, polygons, slot_colors.tolist(), color_changed.tolist()):
+            self.canvas.coords(poly_id, polygon)
+            if changed:
+                self.canvas.itemconfigure(poly_id, fill=HEX_BLUE[color])
+        self._slot_colors[:num_drawn] = slot_colors
+        self._show_polygons(num_drawn)
+        
+        # Update vertices from the already projected coordinates as flat x1, y1, x2, y2 rows
+        dots = np.empty((len(screen_x), 4), dtype=screen_x.dtype)
+        dots[:, 0::2] = screen_x[:, np.newaxis] + [-3, 3]
+        dots[:, 1::2] = screen_y[:, np.newaxis] + [-3, 3]
+        # Only draw if we have valid coordinates, dots of invalid vertices are hidden
+        valid = ~np.isnan(dots).any(axis=1)
+        for dot_id, dot, is_valid in zip(self._dot_ids, dots.tolist(), valid.tolist()):
+            if is_valid:
+                self.canvas.coords(dot_id, dot)
+        self._show_dots(valid)
 
     def start_drag(self, event):
         """Record the starting position of a drag operation.
@@ -147,11 +262,28 @@ class Renderer3D(BaseRenderer):
         """
         self.last_x = event.x
         self.last_y = event.y
+        
+        # Outlines double the per-face drawing work, leave them off while dragging
+        self._dragging = True
+        self.canvas.itemconfigure('face', outline='')
+    
+    def stop_drag(self, event, obj: Optional[Object3D]):
+        """Finish a drag operation and render the final view with polygon outlines.
+
+        Args:
+            event: tkinter mouse event
+            obj (Optional[Object3D]): the 3D object to render, None if no object is loaded
+        """
+        self._dragging = False
+        self.canvas.itemconfigure('face', outline='blue')
+        if obj is not None:
+            self.render(obj)
     
     def drag(self, event, obj: Object3D):
         """Handle mouse drag for rotation.
 
-        Updates rotation angles based on mouse movement and rerenders the object.
+        Updates rotation angles based on mouse movement and schedules a rerender of the object.
+        Motion events arriving before the scheduled render runs are coalesced into it.
 
         Args:
             event: tkinter mouse event
@@ -160,12 +292,26 @@ class Renderer3D(BaseRenderer):
         dx = event.x - self.last_x
         dy = event.y - self.last_y
         
+        # Tk can report motion without any pointer movement, nothing would change on screen
+        if dx == 0 and dy == 0:
+            return
+        
         self.rotation_y += dx * 0.01
         self.rotation_x += dy * 0.01
         
         self.last_x = event.x
         self.last_y = event.y
         
+        if self._render_job is None:
+            self._render_job = self.canvas.after_idle(self._flush_render, obj)
+    
+    def _flush_render(self, obj: Object3D):
+        """Render the object with the latest rotation once Tk is idle.
+
+        Args:
+            obj (Object3D): the 3D object to render
+        """
+        self._render_job = None
         self.render(obj)
 
 class Application:
@@ -186,9 +332,9 @@ class Application:
         self.renderer = Renderer3D(self.canvas)
         self.object = None
         
-        self.canvas.bind("<Button-1>", self.renderer.start_drag)
         self.canvas.bind("<Button-1>", self.renderer.start_drag)
         self.canvas.bind("<B1-Motion>", self.handle_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.handle_release)
     
     def load_file(self):
         """Load 3D object from a file"""
@@ -208,6 +354,14 @@ class Application:
         if self.object:
             self.renderer.drag(event, self.object)
     
+    def handle_release(self, event):
+        """Handle mouse release events ending an object rotation.
+
+        Args:
+            event: tkinter mouse event
+        """
+        self.renderer.stop_drag(event, self.object)
+    
     def run(self):
         """Start the application"""
         self.root.mainloop()